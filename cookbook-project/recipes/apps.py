@@ -1,5 +0,0 @@
-from django.apps import AppConfig
-
-class RecipesConfig(AppConfig):
-    default_auto_field = 'django.db.models.BigAutoField'
-    name = 'recipes'
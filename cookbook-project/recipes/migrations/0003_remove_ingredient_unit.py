@@ -1,17 +0,0 @@
-# Generated by Django 5.1.7 on 2025-04-08 02:34
-
-from django.db import migrations
-
-
-class Migration(migrations.Migration):
-
-    dependencies = [
-        ('recipes', '0002_cookingstep'),
-    ]
-
-    operations = [
-        migrations.RemoveField(
-            model_name='ingredient',
-            name='unit',
-        ),
-    ]
@@ -1,21 +0,0 @@
-# Generated by Django 5.1.7 on 2025-04-08 04:41
-
-from django.db import migrations, models
-
-
-class Migration(migrations.Migration):
-
-    dependencies = [
-        ('recipes', '0003_remove_ingredient_unit'),
-    ]
-
-    operations = [
-        migrations.CreateModel(
-            name='Unit',
-            fields=[
-                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('name', models.CharField(max_length=20, unique=True)),
-                ('abbreviation', models.CharField(blank=True, max_length=10)),
-            ],
-        ),
-    ]
@@ -1,28 +0,0 @@
-# Generated by Django 5.1.7 on 2025-04-08 04:41
-
-from django.db import migrations, models
-import django.core.validators
-import django.db.models.deletion
-
-
-class Migration(migrations.Migration):
-
-    dependencies = [
-        ('recipes', '0004_create_unit_model'),
-    ]
-
-    operations = [
-        migrations.CreateModel(
-            name='DishIngredient',
-            fields=[
-                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('quantity', models.DecimalField(decimal_places=2, max_digits=6, validators=[django.core.validators.MinValueValidator(0.01)])),
-                ('dish', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='recipes.dish')),
-                ('ingredient', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='recipes.ingredient')),
-                ('unit', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, to='recipes.unit')),
-            ],
-            options={
-                'unique_together': {('dish', 'ingredient')},
-            },
-        ),
-    ]
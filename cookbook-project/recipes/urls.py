@@ -1,6 +0,0 @@
-from django.urls import path
-from . import views
-
-urlpatterns = [
-    path('', views.dish_list, name='dish_list'),
-]
\ No newline at end of file
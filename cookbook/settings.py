@@ -65,6 +65,7 @@ REST_FRAMEWORK = {
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'recipes.middleware.LimitedUploadMiddleware',     # rejects oversized uploads before the body is read
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -99,6 +100,8 @@ WSGI_APPLICATION = 'cookbook.wsgi.application'
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
 #Django's default SQLite database configuration
+# no longer usable, not even for running the tests: the migrations need PostgreSQL (pg_trgm, expression indexes)
+# and so does the admin (ArrayAgg), so point DATABASE_URL at a PostgreSQL database
 # DATABASES = {
 #     'default': {
 #         'ENGINE': 'django.db.backends.sqlite3',
@@ -111,7 +114,10 @@ WSGI_APPLICATION = 'cookbook.wsgi.application'
 DATABASES = {
     'default': dj_database_url.parse(
         config('DATABASE_URL'),  # Uses the .env value
-        conn_max_age=600,
+        conn_max_age=config('CONN_MAX_AGE', cast=int, default=600),     # keep connections open between requests instead of reconnecting each time
+        conn_health_checks=True,                                        # ping a reused connection first so a dropped one gets replaced instead of erroring the request
+        # set to True when connecting through PgBouncer in transaction pooling mode, which can't keep server-side cursors open
+        disable_server_side_cursors=config('DISABLE_SERVER_SIDE_CURSORS', cast=bool, default=False),
         ssl_require=True
     )
 }
@@ -166,4 +172,8 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # At the bottom of settings.py
 MEDIA_URL = '/media/'  # URL prefix for media files
-MEDIA_ROOT = BASE_DIR / 'media'  # Local filesystem path
\ No newline at end of file
+MEDIA_ROOT = BASE_DIR / 'media'  # Local filesystem path
+
+# Largest request body accepted by recipes.middleware.LimitedUploadMiddleware
+# the dish form can carry a dish image (max 5MB each) plus step images, so this covers a few of them
+MAX_UPLOAD_REQUEST_SIZE = config('MAX_UPLOAD_REQUEST_SIZE', cast=int, default=20 * 1024 * 1024)
\ No newline at end of file
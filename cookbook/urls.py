@@ -18,25 +18,30 @@ from django.contrib import admin
 from django.urls import path, include                               # Add 'include'
 from django.conf import settings                                    # Add 'settings'
 from django.conf.urls.static import static                          # Add 'static'
+from django.views.decorators.cache import cache_page                # Add 'cache_page'
+from django.views.decorators.vary import vary_on_headers            # Add 'vary_on_headers'
+from functools import wraps
 from rest_framework.routers import DefaultRouter                    # Add 'DefaultRouter'
 from recipes import views                                           # Add 'views'
 
-# Create a custom router that forces /api/ prefix for all endpoints
+# Custom router for the /api/ root listing.
+# The router urls are only ever included under 'api/', so DRF's reverse() already returns /api/-prefixed links
+# and there is nothing to rewrite per request -- the only customization left is caching the listing.
 class APIRootRouter(DefaultRouter):
     def get_api_root_view(self, api_urls=None):
         view = super().get_api_root_view(api_urls=api_urls)
-        def wrapped_view(request, *args, **kwargs):
-            response = view(request, *args, **kwargs)
-            # Ensure all URLs in the response include /api/ prefix
-            if response.data:
-                for key in response.data:
-                    if not response.data[key].startswith('http://127.0.0.1:8000/api/'):
-                        response.data[key] = response.data[key].replace(
-                            'http://127.0.0.1:8000/',
-                            'http://127.0.0.1:8000/api/'
-                        )
-            return response
-        return wrapped_view
+        # the root listing only changes when routes change, so cache the response for an hour
+        # vary on Accept so the browsable API and JSON variants don't overwrite each other
+        cached_view = cache_page(60 * 60)(vary_on_headers('Accept', 'Cookie')(view))
+
+        # the browsable page shows the logged in user and a CSRF token, so only anonymous requests share the cache
+        # (a session or token can only arrive through a cookie or the Authorization header)
+        @wraps(view)
+        def api_root(request, *args, **kwargs):
+            if request.COOKIES or 'HTTP_AUTHORIZATION' in request.META:
+                return view(request, *args, **kwargs)
+            return cached_view(request, *args, **kwargs)
+        return api_root
 
 router = APIRootRouter()                                          
 router.register(r'dishes', views.DishViewSet, basename='dish')
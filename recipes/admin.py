@@ -1,14 +1,54 @@
 """
 This file customizes the Django admin interface for the recipe app, enhancing how models are displayed and managed.
 """
-import os
-import gc
-from django.core.exceptions import ValidationError
+from concurrent.futures import ThreadPoolExecutor
 from django.contrib import admin
+from django.db.models import Count, F
+from django.contrib.postgres.aggregates import ArrayAgg
 from django.utils.html import format_html
-from .models import Dish, Ingredient, GroceryItem, CookingStep, DishIngredient, Unit
+from django.utils.safestring import mark_safe
+from .models import Dish, Ingredient, GroceryItem, CookingStep, DishIngredient, Unit, _delete_image
 from .forms import DishForm, GroceryItemForm
 
+# placeholder shown until an image is picked, filled in by dish_preview.js
+_LIVE_PREVIEW_HTML = mark_safe('<img id="live-preview" style="max-height: 100px; display: none;"/>')
+
+"""
+Bucketed time filters for the dish changelist.
+Filtering on the raw field makes the admin run a SELECT DISTINCT over the whole table just to build the sidebar,
+fixed buckets don't need a query at all.
+"""
+class MinutesRangeListFilter(admin.SimpleListFilter):
+    field_name = None
+    buckets = (                                                 # (value, label, from, up to)
+        ('0-15', 'Under 15 mins', 0, 15),
+        ('15-30', '15 to 30 mins', 15, 30),
+        ('30-60', '30 mins to 1 hour', 30, 60),
+        ('60+', 'Over 1 hour', 60, None),
+    )
+
+    def lookups(self, request, model_admin):
+        return [(value, label) for value, label, _, _ in self.buckets]
+
+    def queryset(self, request, queryset):
+        for value, _, low, high in self.buckets:
+            if self.value() == value:
+                filters = {f'{self.field_name}__gte': low}
+                if high is not None:
+                    filters[f'{self.field_name}__lt'] = high
+                return queryset.filter(**filters)
+        return queryset
+
+class PrepTimeListFilter(MinutesRangeListFilter):
+    title = 'prep time'
+    parameter_name = 'prep_time_range'
+    field_name = 'prep_time'
+
+class CookTimeListFilter(MinutesRangeListFilter):
+    title = 'cook time'
+    parameter_name = 'cook_time_range'
+    field_name = 'cook_time'
+
 class CookingStepInline(admin.TabularInline):
     model = CookingStep
     extra = 1                                                   # shows 1 empty form by default
@@ -20,13 +60,21 @@ class DishIngredientInline(admin.TabularInline):
     extra = 1
     autocomplete_fields = ['ingredient', 'unit']
 
+    # narrow the FK querysets to the columns the widgets actually render, so each inline row doesn't load full rows
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if db_field.name == 'ingredient':
+            kwargs['queryset'] = Ingredient.objects.only('id', 'name').order_by('name')
+        elif db_field.name == 'unit':
+            kwargs['queryset'] = Unit.objects.only('id', 'name', 'abbreviation').order_by('name')
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
 """
 This class customizes the Django admin interface for the Dish model.
 methods
-1. total_time
-2. ingredient_list
-3. image_preview
-4. save_model
+1. get_queryset
+2. total_time
+3. ingredient_list
+4. image_preview
 5. delete_queryset
 6. save_formset
 """
@@ -34,7 +82,7 @@ methods
 class DishAdmin(admin.ModelAdmin):
     form = DishForm # Custom form for Dish                                                                      # custom form
     list_display = ('name', 'prep_time', 'cook_time', 'total_time', 'ingredient_list', 'image_preview')
-    list_filter = ('prep_time', 'cook_time')
+    list_filter = (PrepTimeListFilter, CookTimeListFilter)
     search_fields = ('name',)
     inlines = [DishIngredientInline, CookingStepInline]
     
@@ -48,13 +96,22 @@ class DishAdmin(admin.ModelAdmin):
         }),
     )
     readonly_fields = ('image_preview',)
+
+    # compute the list_display columns in SQL so the changelist doesn't build them row by row in Python
+    # (ArrayAgg is PostgreSQL only, as is the schema: see the trigram index on GroceryItem)
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            _total_time=F('prep_time') + F('cook_time'),
+            _ingredient_names=ArrayAgg('ingredients__name', ordering='ingredients__name'),
+        )
     
-    def total_time(self, obj):                                                    # calculates total time in mins of prep and cook time
-        return f"{obj.prep_time + obj.cook_time} mins"
+    def total_time(self, obj):                                                    # total time in mins of prep and cook time, summed by the DB
+        return f"{obj._total_time} mins"
     total_time.short_description = 'Total Time'
+    total_time.admin_order_field = '_total_time'
     
     def ingredient_list(self, obj):                                               # lists first 3 ingredients of the dish               
-        return ", ".join([i.name for i in obj.ingredients.all()[:3]])
+        return ", ".join(name for name in obj._ingredient_names[:3] if name)       # a dish without ingredients aggregates to [None]
     ingredient_list.short_description = 'Ingredients'
 
     def image_preview(self, obj):
@@ -65,9 +122,7 @@ class DishAdmin(admin.ModelAdmin):
                 obj.image.url
             )
         # placeholder if no image
-        return format_html(
-            '<img id="live-preview" style="max-height: 100px; display: none;"/>'
-        )
+        return _LIVE_PREVIEW_HTML
 
     # this is a javascript file to show a live preview of the image
     class Media:
@@ -77,55 +132,70 @@ class DishAdmin(admin.ModelAdmin):
     Override bulk deletion to properly delete images associated with dishes and steps
     """
     def delete_queryset(self, request, queryset):
-        for dish in queryset:
-            # delete main dish image
-            try:
-                if dish.image and os.path.isfile(dish.image.path):
-                    os.remove(dish.image.path)
-            except PermissionError:
-                gc.collect()
-                if dish.image and os.path.isfile(dish.image.path):
-                    os.remove(dish.image.path)
-            
-            # delete all step images
-            for step in dish.steps.all():
-                try:
-                    if step.image and os.path.isfile(step.image.path):
-                        os.remove(step.image.path)
-                except PermissionError:
-                    gc.collect()
-                    if step.image and os.path.isfile(step.image.path):
-                        os.remove(step.image.path)
+        # collect every dish and step image name first, reading just the image column
+        # rather than building each Dish, its prefetched steps and a FieldFile per image
+        names = list(queryset.exclude(image='').values_list('image', flat=True))
+        names.extend(
+            CookingStep.objects.filter(dish__in=queryset).exclude(image='').values_list('image', flat=True)
+        )
+
+        # the deletes don't depend on each other, so overlap them instead of waiting on each one in turn
+        # a single file isn't worth starting threads for, and never start more workers than there are files
+        if len(names) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(names))) as executor:
+                list(executor.map(_delete_image, names))
+        elif names:
+            _delete_image(names[0])
 
         super().delete_queryset(request, queryset)
         
     def save_formset(self, request, form, formset, change):
         instances = formset.save(commit=False)                  # saves the formset but doesn't commit the changes to the DB yet
+        removed_ingredients = []                                # removed DishIngredient rows get deleted with a single query
+        for obj in formset.deleted_objects:                     # commit=False leaves deletions to us, do them first so re-added rows don't collide
+            if isinstance(obj, DishIngredient):
+                removed_ingredients.append(obj.pk)
+            else:
+                obj.delete()                                    # CookingStep.delete() also removes the step's image
+        if removed_ingredients:
+            DishIngredient.objects.filter(pk__in=removed_ingredients).delete()
+        new_rows = []                                           # new rows get inserted together at the end
+        changed_ingredients = []                                # edited DishIngredient rows get updated together too
         for instance in instances:                              # iterate through each instance in the formset   
             if isinstance(instance, DishIngredient):            # if the instance is a DishIngredient
                 if not instance.dish_id:                        # if the instance doesn't have a dish_id, set it
                     instance.dish = form.instance               # set the dish attribute to the instance of the Dish form being edited
-            instance.save()                                     # saves each instance to the DB
-        formset.save_m2m()                                      # saves the many-to-many relationships if any exist in the formset
+                if instance.pk is None:
+                    new_rows.append(instance)
+                else:
+                    changed_ingredients.append(instance)
+            elif instance.pk is None:                           # a new step, bulk_create still commits an uploaded image
+                new_rows.append(instance)
+            else:
+                instance.save()                                 # edited steps go through save() (CookingStep.save cleans up old images)
+        if changed_ingredients:
+            DishIngredient.objects.bulk_update(changed_ingredients, ['ingredient', 'quantity', 'unit'])
+        if new_rows:
+            formset.model.objects.bulk_create(new_rows)         # one multi-row INSERT instead of one per row (each formset holds one model)
+        if formset.model._meta.many_to_many:                    # neither inline model has m2m fields today, so skip walking the forms
+            formset.save_m2m()                                  # saves the many-to-many relationships if any exist in the formset
 
 @admin.register(Ingredient)
 class IngredientAdmin(admin.ModelAdmin):
     list_display = ('name', 'dish_count')
     search_fields = ('name',)
+    # the dish count annotation below adds a GROUP BY, which makes Django ignore Meta ordering,
+    # so order here to keep the ingredient autocomplete alphabetical and its pages stable
+    ordering = ('name',)
+
+    # count the dishes for every row in a single GROUP BY instead of one COUNT query per ingredient
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(_dish_count=Count('dish'))
 
-    # djangos fetch option doesn't enforce ordering by default
-    # this method's purpose is to make sure that the results are ordered alphabetically, this shows up in ingredients and adding grocery
-    def get_search_results(self, request, queryset, search_term):
-        # get the default results first
-        queryset, use_distinct = super().get_search_results(request, queryset, search_term)
-        
-        # Apply alphabetical ordering to autocomplete results
-        queryset = queryset.order_by('name')
-        return queryset, use_distinct
-    
     def dish_count(self, obj):
-        return obj.dish_set.count()
+        return obj._dish_count
     dish_count.short_description = 'Used In # Dishes'
+    dish_count.admin_order_field = '_dish_count'                # sortable through the annotation
 
 @admin.register(GroceryItem)
 class GroceryItemAdmin(admin.ModelAdmin):
@@ -138,22 +208,7 @@ class GroceryItemAdmin(admin.ModelAdmin):
     
     # Remove the add view fields you don't want to show
     fields = ('name', 'in_cart', 'is_optional')
-    
-    def save_model(self, request, obj, form, change):
-        # Check for duplicates in grocery items only (case-insensitive)
-        duplicate_exists = GroceryItem.objects.filter(
-            name__iexact=obj.name.strip()
-        ).exclude(pk=obj.pk).exists()
-        
-        if duplicate_exists:
-            raise ValidationError(
-                f'"{obj.name}" already exists in your grocery list. '
-                'Please edit the existing item instead.'
-            )
-        
-        # Clean and save the name
-        obj.name = obj.name.strip().title()  # Capitalize first letter of each word
-        super().save_model(request, obj, form, change)
+    # duplicate names are rejected by the form's validation of GroceryItem's unique constraint, so the error shows before anything is written
     
 @admin.register(Unit)
 class UnitAdmin(admin.ModelAdmin):
@@ -11,13 +11,10 @@ This form is used to create or update Dish objects.
 class DishForm(forms.ModelForm):
     class Meta:
         model = Dish
-        fields = '__all__'
+        fields = ('name', 'description', 'image', 'prep_time', 'cook_time')  # 'ingredients' is left out since i'm using DishIngredientInline
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        if 'ingredients' in self.fields:
-            del self.fields['ingredients']                              # remove the 'ingredients' field since i'm using DishIngredientInline
-
         self.fields['prep_time'].widget.attrs['min'] = 1
         self.fields['prep_time'].widget.attrs['max'] = 1440
         self.fields['cook_time'].widget.attrs['min'] = 0
@@ -52,4 +49,7 @@ class GroceryItemForm(forms.ModelForm):
         name = self.cleaned_data.get('name', '').strip()
         if not name:
             raise forms.ValidationError("Grocery item name cannot be empty.")
-        return name.title()  # Capitalize first letter of each word
\ No newline at end of file
+
+        # case-insensitive duplicates are caught by GroceryItem's grocery_name_upper_uniq constraint,
+        # which the form validates (one index-backed query) and reports with the constraint's message
+        return name  # title-cased by GroceryItem.save()
\ No newline at end of file
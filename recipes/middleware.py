@@ -0,0 +1,29 @@
+"""
+Middleware for the recipe app.
+"""
+from django.conf import settings
+from django.http import HttpResponse
+
+"""
+Rejects requests whose declared body size is over MAX_UPLOAD_REQUEST_SIZE before Django reads the body.
+Without this, an oversized photo is streamed to a temp file first and only rejected afterwards by the
+image validators on the model, so we'd pay all the disk I/O for an upload we were always going to refuse.
+Needs to sit above CsrfViewMiddleware, which reads request.POST (and with it the whole upload).
+"""
+class LimitedUploadMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.max_size = settings.MAX_UPLOAD_REQUEST_SIZE
+
+    def __call__(self, request):
+        try:
+            content_length = int(request.META.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            content_length = 0
+        if content_length > self.max_size:
+            return HttpResponse(
+                f"Upload too large. Max request size is {self.max_size / 1024 / 1024:.0f}MB.",
+                status=413,
+                content_type="text/plain",
+            )
+        return self.get_response(request)
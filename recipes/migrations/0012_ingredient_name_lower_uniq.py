@@ -0,0 +1,18 @@
+# Generated by Django 5.1.7 on 2026-10-15 09:12
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0011_groceryitem_delete_grocery'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='ingredient',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('name'), name='ingredient_name_lower_uniq'),
+        ),
+    ]
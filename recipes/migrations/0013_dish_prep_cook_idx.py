@@ -0,0 +1,17 @@
+# Generated by Django 5.1.7 on 2026-10-15 09:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0012_ingredient_name_lower_uniq'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='dish',
+            index=models.Index(fields=['prep_time', 'cook_time'], name='dish_prep_cook_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.7 on 2026-10-15 10:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0013_dish_prep_cook_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='unit',
+            name='abbreviation',
+            field=models.CharField(blank=True, db_index=True, error_messages={'unique': 'This abbreviation already exists.'}, max_length=10),
+        ),
+    ]
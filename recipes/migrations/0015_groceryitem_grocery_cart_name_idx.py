@@ -0,0 +1,17 @@
+# Generated by Django 5.1.7 on 2026-10-15 10:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0014_alter_unit_abbreviation'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='groceryitem',
+            index=models.Index(fields=['-in_cart', 'name'], name='grocery_cart_name_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.1.7 on 2026-10-15 11:26
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0015_groceryitem_grocery_cart_name_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='dish',
+            name='prep_time',
+            field=models.PositiveSmallIntegerField(validators=[django.core.validators.MinValueValidator(1, message='Prep time must be at least 1 minute.'), django.core.validators.MaxValueValidator(1440, message='Prep time cannot exceed 24 hours.')]),
+        ),
+        migrations.AlterField(
+            model_name='dish',
+            name='cook_time',
+            field=models.PositiveSmallIntegerField(validators=[django.core.validators.MinValueValidator(0, message='Cook time cannot be negative.'), django.core.validators.MaxValueValidator(1440, message='Cook time cannot exceed 24 hours.')]),
+        ),
+        migrations.AlterField(
+            model_name='cookingstep',
+            name='step_number',
+            field=models.PositiveSmallIntegerField(validators=[django.core.validators.MinValueValidator(1)]),
+        ),
+    ]
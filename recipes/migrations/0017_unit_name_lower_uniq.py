@@ -0,0 +1,18 @@
+# Generated by Django 5.1.7 on 2026-10-15 21:20
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0016_alter_small_integer_fields'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='unit',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('name'), name='unit_name_lower_uniq'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.1.7 on 2026-10-15 21:56
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models.functions import Upper
+
+def merge_case_duplicates(apps, schema_editor):
+    # the unique constraint can't be added while case variants of a name exist, so fold each set into its oldest item
+    GroceryItem = apps.get_model('recipes', 'GroceryItem')
+    kept = {}
+    duplicates = []
+    for item in GroceryItem.objects.annotate(upper_name=Upper('name')).order_by('pk'):
+        first = kept.setdefault(item.upper_name, item)
+        if first is item:
+            continue
+        first.in_cart = first.in_cart or item.in_cart                   # in the cart if any copy was
+        first.is_optional = first.is_optional and item.is_optional      # optional only if every copy was
+        if item.quantity is not None:
+            if first.quantity is None:
+                first.quantity, first.unit_id = item.quantity, item.unit_id     # take the copy's amount
+            elif first.unit_id == item.unit_id:
+                first.quantity += item.quantity                                 # same unit, add the amounts up
+            else:
+                # amounts in different units can't be added up, so report the one being dropped
+                print(
+                    f"\n  Merged grocery item {item.pk} into {first.pk} ({first.name}), "
+                    f"dropping its quantity {item.quantity} (unit id {item.unit_id})"
+                )
+        duplicates.append(item.pk)
+
+    if duplicates:
+        GroceryItem.objects.bulk_update(
+            kept.values(), ['in_cart', 'is_optional', 'quantity', 'unit'], batch_size=500
+        )
+        GroceryItem.objects.filter(pk__in=duplicates).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0017_unit_name_lower_uniq'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_case_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='groceryitem',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Upper('name'), name='grocery_name_upper_uniq', violation_error_message='This item already exists in your grocery list. Please edit the existing item instead.'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.7 on 2026-10-15 23:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0019_groceryitem_grocery_name_trgm'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='dish',
+            index=models.Index(fields=['cook_time'], name='dish_cook_time_idx'),
+        ),
+    ]
@@ -10,8 +10,54 @@ from django.core.validators import (
     FileExtensionValidator,
 )
 from django.core.exceptions import ValidationError
-import os
-import gc
+from django.core.files.storage import default_storage
+from django.db.models.functions import Lower, Upper
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from PIL import Image as PILImage
+import time
+
+"""
+Deletes a stored image through the storage backend rather than os.remove on a local path,
+so the cleanup keeps working if media moves off the local disk (S3 etc.).
+Storages treat a file that is already gone as deleted.
+Note: PermissionError is raised on Windows while another handle still has the file open, so we back off briefly and retry
+instead of forcing a full gc.collect() (which pauses the whole process); the last attempt lets the error through.
+"""
+def _delete_image(name, storage=default_storage, tries=3):
+    for attempt in range(tries):
+        try:
+            storage.delete(name)
+            return
+        except PermissionError:
+            time.sleep(0.01 * (1 << attempt))
+    storage.delete(name)
+
+# shared by the Dish and CookingStep image fields
+IMAGE_EXTENSION_VALIDATOR = FileExtensionValidator(allowed_extensions=["jpg", "jpeg", "png", "webp"])
+
+"""
+Groups of terms that should be considered duplicates of each other.
+Add logic here for terms that should be considered duplicates.
+TERM_TO_GROUP maps every term to its whole group, built once at import so a lookup is a single dict probe.
+The API serializers only ever treated units of measure as similar, so they use MEASURE_TERM_TO_GROUP,
+which leaves out the time groups the models also check.
+"""
+MEASURE_TERM_GROUPS = (
+    ('pieces', 'piece', 'pcs', 'pc'),
+    ('tablespoons', 'tablespoon', 'tbsp', 'tbs'),
+    ('teaspoons', 'teaspoon', 'tsp', 'ts'),
+    ('pounds', 'pound', 'lbs', 'lb'),
+    ('ounces', 'ounce', 'oz'),
+    ('cups', 'cup', 'c'),
+    ('grams', 'gram', 'g'),
+    ('kilograms', 'kilogram', 'kg'),
+)
+TIME_TERM_GROUPS = (
+    ('minutes', 'minute', 'mins', 'min'),
+    ('hours', 'hour', 'hrs', 'hr'),
+)
+MEASURE_TERM_TO_GROUP = {term: group for group in MEASURE_TERM_GROUPS for term in group}
+TERM_TO_GROUP = {term: group for group in MEASURE_TERM_GROUPS + TIME_TERM_GROUPS for term in group}
 
 class BaseNormalizationMixin:
     def _normalize_name(self, name, is_ingredient=False, is_unit=False, is_abbr=False):
@@ -19,34 +65,11 @@ class BaseNormalizationMixin:
     
     """
         Generate similar terms for duplicate checking.
-        Add logic here for terms that should be considered duplicates.
+        Returns the term's whole group, or just the term itself if it isn't in one.
     """
     def _get_similar_terms(self, name):
         name = name.strip().lower()
-        similar_terms = [name]
-        
-        # define groups of similar terms
-        similar_groups = [
-            ['pieces', 'piece', 'pcs', 'pc'],
-            ['tablespoons', 'tablespoon', 'tbsp', 'tbs'],
-            ['teaspoons', 'teaspoon', 'tsp', 'ts'],
-            ['pounds', 'pound', 'lbs', 'lb'],
-            ['ounces', 'ounce', 'oz'],
-            ['cups', 'cup', 'c'],
-            ['minutes', 'minute', 'mins', 'min'],
-            ['hours', 'hour', 'hrs', 'hr'],
-            ['grams', 'gram', 'g'],
-            ['kilograms', 'kilogram', 'kg'],
-        ]
-
-    # find which group this term belongs to
-        for group in similar_groups:
-            if name in group:
-                similar_terms.extend(group)
-                break
-        
-        # remove duplicates and return
-        return list(set(similar_terms))
+        return TERM_TO_GROUP.get(name, (name,))
     
 """
 Ingredient model to store information about each ingredients with a single field for name.
@@ -61,12 +84,29 @@ class Ingredient(models.Model, BaseNormalizationMixin):
         error_messages={"unique": "This ingredient name already exist."},
     )
 
+    class Meta:
+        constraints = [
+            # names are lowercased in save(), this lets the database enforce it too (covers bulk_create/update paths)
+            models.UniqueConstraint(Lower("name"), name="ingredient_name_lower_uniq"),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        # remember the stored name so save() can tell whether it needs validating again
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_name = instance.__dict__.get("name")
+        return instance
+
     def __str__(
         self,
     ):  # returns a string of the ingredient, which is the name of the ingredient
         return self.name
 
     def dish_count(self):  # returns the number of dishes that use this ingredient
+        # use the count annotated by the queryset (see IngredientAdmin.get_queryset) when there is one
+        annotated = getattr(self, "_dish_count", None)
+        if annotated is not None:
+            return annotated
         return self.dish_set.count()
 
     def clean(self):
@@ -77,15 +117,11 @@ class Ingredient(models.Model, BaseNormalizationMixin):
         normalized_name = self._normalize_name(self.name, is_ingredient=True)
         similar_terms = self._get_similar_terms(normalized_name)
 
-        # build query to check for any similar terms
-        query = models.Q()
-        for term in similar_terms:
-            query |= models.Q(name__iexact=term)
+        # names are stored lowercased, so an exact IN lookup matches and can use the unique index (iexact can't)
+        # a single query for the conflict instead of exists() followed by first()
+        conflict = Ingredient.objects.filter(name__in=similar_terms).exclude(pk=self.pk).only("id", "name").first()
 
-        duplicates = Ingredient.objects.filter(query).exclude(pk=self.pk)
-
-        if duplicates.exists():
-            conflict = duplicates.first()
+        if conflict is not None:
             raise ValidationError(
                 f'Similar ingredient already exists: "{conflict.name}" (ID: {conflict.id}). '
                 f'Terms like "{", ".join(similar_terms)}" are considered duplicates.'
@@ -93,8 +129,12 @@ class Ingredient(models.Model, BaseNormalizationMixin):
 
     def save(self, *args, **kwargs):
         self.name = self._normalize_name(self.name, is_ingredient=True)
-        self.full_clean()
+        # an existing ingredient whose name hasn't changed was already validated, skip the duplicate queries
+        if self._state.adding or self.name != getattr(self, "_loaded_name", None):
+            # clean() already covers case-insensitive duplicates, so skip the constraint's own lookup query
+            self.full_clean(validate_constraints=False)
         super().save(*args, **kwargs)
+        self._loaded_name = self.name
 
     dish_count.short_description = (
         "Used In # Dishes"  # renames the column in the admin panel
@@ -120,13 +160,13 @@ class Dish(models.Model):
             "ingredient",
         ),  # This allows Django to create m2m relationships between Dish and Ingredient through DishIngredient
     )  # Example: Dish: Pasta, Ingredient: Ground Beef, DishIngredient: Pasta -> 2 lbs Ground Beef
-    prep_time = models.PositiveIntegerField(
+    prep_time = models.PositiveSmallIntegerField(
         validators=[
             MinValueValidator(1, message="Prep time must be at least 1 minute."),
             MaxValueValidator(1440, message="Prep time cannot exceed 24 hours."),
         ]
     )
-    cook_time = models.PositiveIntegerField(
+    cook_time = models.PositiveSmallIntegerField(
         validators=[
             MinValueValidator(0, message="Cook time cannot be negative."),
             MaxValueValidator(1440, message="Cook time cannot exceed 24 hours."),
@@ -137,6 +177,9 @@ class Dish(models.Model):
     also to prevent too large images being uploaded
     """
     def validate_image_size(value):
+        # an image that is already stored was checked when it was uploaded, don't stat it again on every save
+        if getattr(value, "_committed", False):
+            return
         filesize = value.size
         max_size = 5 * 1024 * 1024  # 5MB, iPhone photos are often 3-8MB
         if filesize > max_size:
@@ -150,10 +193,13 @@ class Dish(models.Model):
     also I want the iamges to be uniform in size for the grid view
     """
     def validate_image_dimensions(value):
-        from PIL import Image  # Import the Image class
-
-        img = Image.open(value)  # Open the image
-        width, height = img.size  # Get the image dimensions
+        # same as above, only a new upload needs opening (re-reading a stored image means fetching it from storage)
+        if getattr(value, "_committed", False):
+            return
+        # Image.open only parses the header, reading .size doesn't decode any pixels
+        with PILImage.open(value) as img:  # Open the image
+            width, height = img.size  # Get the image dimensions
+        value.seek(0)  # rewind so the file is saved from the start
         max_resolution = 3000  # 3K resolution
         if width > max_resolution or height > max_resolution:
             raise ValidationError(
@@ -164,41 +210,31 @@ class Dish(models.Model):
         upload_to="dish_images/",
         blank=True,
         validators=[
-            FileExtensionValidator(allowed_extensions=["jpg", "jpeg", "png", "webp"]),
+            IMAGE_EXTENSION_VALIDATOR,
             validate_image_size,
             validate_image_dimensions,
         ],
         help_text="Upload image (max 5MB, 3000x3000px, JPG/PNG/WEBP)",
     )
 
+    class Meta:
+        indexes = [
+            # back the prep/cook time filters in the admin changelist: the composite index serves prep_time ranges,
+            # a range on cook_time alone (the cook time filter, DishViewSet's ?cook_time=) needs its own
+            models.Index(fields=["prep_time", "cook_time"], name="dish_prep_cook_idx"),
+            models.Index(fields=["cook_time"], name="dish_cook_time_idx"),
+        ]
+
     """
-    Checks the following:
-    1. Prep time and cook time are not None
-    2. Total time does not exceed 4 hours
+    Checks that the total time does not exceed 4 hours.
+    Missing prep/cook times are already reported by the field validation that full_clean runs first
+    (neither field allows null), and clean() still runs after that fails, so only check when both are set.
     """
     def clean(self):
-        """
-        Creating an empty dictionary to store errors allows the method to collect
-        and store multiple errors in a single data structure, so it can return a single error
-        object all the error messages, rather than raising an error for each validation failure.
-        """
-        errors = {}
-
-        if self.prep_time is None:
-            errors["prep_time"] = "Prep time is required."
-        if self.cook_time is None:
-            errors["cook_time"] = "Cook time is required."
-
-        """
-        Only check total time if both times exist
-        We don't want to check if one of them is None
-        """
-        if self.prep_time is not None and self.cook_time is not None:
-            if (self.prep_time + self.cook_time) > 240:
-                errors["cook_time"] = "Total cooking time exceeds 4 hours."
-
-        if errors:
-            raise ValidationError(errors)
+        if self.prep_time is None or self.cook_time is None:
+            return
+        if self.prep_time + self.cook_time > 240:
+            raise ValidationError({"cook_time": "Total cooking time exceeds 4 hours."})
 
     def total_time(self):
         return self.prep_time + self.cook_time
@@ -209,42 +245,36 @@ class Dish(models.Model):
     """
     Delete all associated images when dish is deleted from the database.
     This is to prevent orphaned images from being left on the server.
-    Note: gc is a garbage collector, it helps manage memory by automatically deleting objects that are no longer needed.
-    Note: PermissionError is an exception class in Python that is raised when a program attempts to perform an operation that requires permission or access rights.
     """
     def delete(self, *args, **kwargs):
+        # collect the dish image and all step images first, then delete them in one pass
+        # only the stored file names are needed, so read that one column instead of building a CookingStep per row
+        names = []
         if self.image:
-            try:
-                if os.path.isfile(self.image.path):
-                    os.remove(self.image.path)
-            except PermissionError:
-                gc.collect()
-                if os.path.isfile(self.image.path):
-                    os.remove(self.image.path)
-
-        # Delete all step images
-        for (step) in (self.steps.all()):  # uses the reverse relation from Dish to CookingStep, allows access to all steps for this dish
-            if step.image:
-                try:
-                    if os.path.isfile(step.image.path):
-                        os.remove(step.image.path)
-                except PermissionError:
-                    gc.collect()
-                    if os.path.isfile(step.image.path):
-                        os.remove(step.image.path)
+            self.image.close()  # release our own handle first, Windows won't delete a file that is still open
+            names.append(self.image.name)
+        names.extend(self.steps.exclude(image="").values_list("image", flat=True))  # uses the reverse relation from Dish to CookingStep
+        for name in names:
+            _delete_image(name)
         super().delete(*args, **kwargs)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        # remember the stored image name so save() can spot a replaced image without re-reading the row
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_image = instance.__dict__.get("image")  # None if the image column was deferred
+        return instance
+
     def save(self, *args, **kwargs):
         """Delete old image if being updated with a new one"""
         if self.pk:  # Only for existing instances
-            try:
-                old_instance = Dish.objects.get(pk=self.pk)
-                if old_instance.image and old_instance.image != self.image:
-                    if os.path.isfile(old_instance.image.path):
-                        os.remove(old_instance.image.path)
-            except Dish.DoesNotExist:
-                pass
+            old_image = getattr(self, "_loaded_image", None)
+            if old_image is None:  # not loaded from the DB (or deferred), so look the stored name up
+                old_image = Dish.objects.filter(pk=self.pk).values_list("image", flat=True).first()
+            if old_image and old_image != self.image.name:
+                _delete_image(old_image)
         super().save(*args, **kwargs)
+        self._loaded_image = self.image.name or ""
 
 """
 This model is used to store the units of measurement for ingredients.
@@ -258,51 +288,74 @@ class Unit(models.Model, BaseNormalizationMixin):
     abbreviation = models.CharField(
         max_length=10,
         blank=True,
+        db_index=True,  # looked up alongside name when checking for similar units
         error_messages={"unique": "This abbreviation already exists."},
     )
 
+    class Meta:
+        constraints = [
+            # same as Ingredient: names are lowercased in save(), let the database enforce it for bulk_create paths too
+            models.UniqueConstraint(Lower("name"), name="unit_name_lower_uniq"),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        # remember the stored name/abbreviation so save() can tell whether they need validating again
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_names = (instance.__dict__.get("name"), instance.__dict__.get("abbreviation"))
+        return instance
+
     def __str__(self):
         return self.abbreviation if self.abbreviation else self.name
 
     def clean(self):
         """Validate both name and abbreviation for conflicts including similar terms"""
-        # check name conflicts
         name_similar_terms = self._get_similar_terms(self.name)
-        name_query = models.Q()
-        for term in name_similar_terms:
-            name_query |= models.Q(name__iexact=term) | models.Q(abbreviation__iexact=term)
-
-        name_conflicts = Unit.objects.filter(name_query).exclude(pk=self.pk)
-        
-        if name_conflicts.exists():
-            conflict = name_conflicts.first()
-            raise ValidationError({
-                "name": f'Unit conflict with "{conflict.name}" (ID: {conflict.id}). '
-                       f'Similar terms: {", ".join(name_similar_terms)}'
-            })
+        abbr_similar_terms = self._get_similar_terms(self.abbreviation) if self.abbreviation else ()
+        all_terms = set(name_similar_terms).union(abbr_similar_terms)
 
-        # check abbreviation conflicts if exists
-        if self.abbreviation:
-            abbr_similar_terms = self._get_similar_terms(self.abbreviation)
-            abbr_query = models.Q()
-            for term in abbr_similar_terms:
-                abbr_query |= models.Q(name__iexact=term) | models.Q(abbreviation__iexact=term)
-
-            abbr_conflicts = Unit.objects.filter(abbr_query).exclude(pk=self.pk)
-            
-            if abbr_conflicts.exists():
-                conflict = abbr_conflicts.first()
+        # one query covers both checks, then sort out below which field each conflict belongs to
+        conflicts = list(
+            Unit.objects.filter(models.Q(name__in=all_terms) | models.Q(abbreviation__in=all_terms))
+            .exclude(pk=self.pk)
+            .only("id", "name", "abbreviation")
+            .order_by("pk")
+        )
+
+        # check name conflicts
+        for conflict in conflicts:
+            if conflict.name in name_similar_terms or conflict.abbreviation in name_similar_terms:
                 raise ValidationError({
-                    "abbreviation": f'Abbreviation conflict with "{conflict.name}" (ID: {conflict.id}). '
-                                   f'Similar terms: {", ".join(abbr_similar_terms)}'
+                    "name": f'Unit conflict with "{conflict.name}" (ID: {conflict.id}). '
+                           f'Similar terms: {", ".join(name_similar_terms)}'
                 })
 
+        # anything left can only have matched through the abbreviation's terms
+        if conflicts:
+            conflict = conflicts[0]
+            raise ValidationError({
+                "abbreviation": f'Abbreviation conflict with "{conflict.name}" (ID: {conflict.id}). '
+                               f'Similar terms: {", ".join(abbr_similar_terms)}'
+            })
+
     def save(self, *args, **kwargs):
-        self.name = self._normalize_name(self.name, is_unit=True)
-        if self.abbreviation:
-            self.abbreviation = self._normalize_name(self.abbreviation, is_abbr=True)
-        self.full_clean()
+        # an existing unit whose name and abbreviation are unchanged was already normalized and validated
+        if self._state.adding or (self.name, self.abbreviation) != getattr(self, "_loaded_names", None):
+            self.name = self._normalize_name(self.name, is_unit=True)
+            if self.abbreviation:
+                self.abbreviation = self._normalize_name(self.abbreviation, is_abbr=True)
+            # clean() already covers case-insensitive duplicates, so skip the constraint's own lookup query
+            self.full_clean(validate_constraints=False)
         super().save(*args, **kwargs)
+        self._loaded_names = (self.name, self.abbreviation)
+
+"""
+Default manager for DishIngredient that joins in the dish, ingredient and unit in the same query,
+since __str__ reads all three and would otherwise cost three extra queries per row.
+"""
+class DishIngredientManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().select_related("dish", "ingredient", "unit")
 
 """
 This model is used to store the ingredients for each dish.
@@ -317,6 +370,8 @@ class DishIngredient(models.Model):
     )
     unit = models.ForeignKey(Unit, on_delete=models.PROTECT)
 
+    objects = DishIngredientManager()
+
     class Meta:
         unique_together = (
             "dish",
@@ -351,9 +406,35 @@ class GroceryItem(models.Model):
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        # the one place the display format is applied, so the form, the API and any other save path agree
+        self.name = self.name.strip().title()  # Capitalize first letter of each word
+        super().save(*args, **kwargs)
+
     class Meta:
         verbose_name_plural = "Grocery Items"
         ordering = ["-in_cart", "name"]
+        indexes = [
+            # matches the default ordering so listing the groceries doesn't need a sort
+            models.Index(fields=["-in_cart", "name"], name="grocery_cart_name_idx"),
+            # trigram index for the API's name__icontains search, which compiles to UPPER(name) LIKE UPPER('%...%')
+            GinIndex(OpClass(Upper("name"), name="gin_trgm_ops"), name="grocery_name_trgm"),
+        ]
+        constraints = [
+            # no two items that differ only in case; its unique index on UPPER(name) also serves name__iexact lookups
+            models.UniqueConstraint(
+                Upper("name"),
+                name="grocery_name_upper_uniq",
+                violation_error_message="This item already exists in your grocery list. Please edit the existing item instead.",
+            ),
+        ]
+
+"""
+Default manager for CookingStep, joins in the dish since __str__ reads its name.
+"""
+class CookingStepManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().select_related("dish")
 
 """
 This model is used to store the steps for each dish.
@@ -363,16 +444,18 @@ Two methods:
 """
 class CookingStep(models.Model):
     dish = models.ForeignKey(Dish, on_delete=models.CASCADE, related_name="steps")
-    step_number = models.PositiveIntegerField(validators=[MinValueValidator(1)])
+    step_number = models.PositiveSmallIntegerField(validators=[MinValueValidator(1)])
     instruction = models.TextField()
     image = models.ImageField(
         upload_to="step_images/",
         blank=True,
         validators=[
-            FileExtensionValidator(allowed_extensions=["jpg", "jpeg", "png", "webp"]),
+            IMAGE_EXTENSION_VALIDATOR,
         ],
     )
 
+    objects = CookingStepManager()
+
     class Meta:
         ordering = ["step_number"]
         unique_together = [
@@ -386,18 +469,24 @@ class CookingStep(models.Model):
     def delete(self, *args, **kwargs):
         """Delete the image file when the step is deleted"""
         if self.image:
-            if os.path.isfile(self.image.path):
-                os.remove(self.image.path)
+            self.image.close()  # release our own handle first, Windows won't delete a file that is still open
+            _delete_image(self.image.name)
         super().delete(*args, **kwargs)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        # remember the stored image name so save() can spot a replaced image without re-reading the row
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_image = instance.__dict__.get("image")  # None if the image column was deferred
+        return instance
+
     def save(self, *args, **kwargs):
         """Delete old image if being updated with a new one"""
         if self.pk:  # Only for existing instances
-            try:
-                old_instance = CookingStep.objects.get(pk=self.pk)
-                if old_instance.image and old_instance.image != self.image:
-                    if os.path.isfile(old_instance.image.path):
-                        os.remove(old_instance.image.path)
-            except CookingStep.DoesNotExist:
-                pass
-        super().save(*args, **kwargs)
\ No newline at end of file
+            old_image = getattr(self, "_loaded_image", None)
+            if old_image is None:  # not loaded from the DB (or deferred), so look the stored name up
+                old_image = CookingStep.objects.filter(pk=self.pk).values_list("image", flat=True).first()
+            if old_image and old_image != self.image.name:
+                _delete_image(old_image)
+        super().save(*args, **kwargs)
+        self._loaded_image = self.image.name or ""
\ No newline at end of file
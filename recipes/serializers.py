@@ -1,8 +1,31 @@
+import copy
 from django.db import models
-from django.db import transaction
+from django.db import transaction, IntegrityError
 from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import serializers
-from .models import Dish, Ingredient, GroceryItem, CookingStep, Unit, DishIngredient
+from .models import Dish, Ingredient, GroceryItem, CookingStep, Unit, DishIngredient, MEASURE_TERM_TO_GROUP
+
+class CachedFieldsModelSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer that builds its fields from the model once per class instead of once per instance.
+    The introspection (model field info + build_field) only depends on Meta, so it is cached on the class
+    and each instance gets a deep copy: fields get bound to their parent serializer, so they can't be shared
+    between instances (Field.__deepcopy__ re-instantiates from the constructor args, which is what DRF already
+    does for declared fields).
+    Set cache_fields = False on a subclass whose fields change per instance.
+    """
+    cache_fields = True
+
+    def get_fields(self):
+        if not self.cache_fields:
+            return super().get_fields()
+        cls = type(self)
+        # looked up in the class's own __dict__ so subclasses don't pick up a parent's fields
+        fields = cls.__dict__.get("_cached_fields")
+        if fields is None:
+            fields = super().get_fields()
+            cls._cached_fields = fields
+        return copy.deepcopy(fields)
 
 class BaseNormalizationMixin:
     """Shared normalization and validation logic"""
@@ -10,39 +33,33 @@ class BaseNormalizationMixin:
         return name.strip().lower()
 
     def _get_similar_terms(self, name):
-        """Use the same similar terms logic as models"""
+        """Same lookup as the models, over the unit of measure groups only: the term's whole group, or just the term"""
         name = name.strip().lower()
-        similar_terms = [name]
-        
-        similar_groups = [
-            ['pieces', 'piece', 'pcs', 'pc'],
-            ['tablespoons', 'tablespoon', 'tbsp', 'tbs'],
-            ['teaspoons', 'teaspoon', 'tsp', 'ts'],
-            ['pounds', 'pound', 'lbs', 'lb'],
-            ['ounces', 'ounce', 'oz'],
-            ['cups', 'cup', 'c'],
-            ['grams', 'gram', 'g'],
-            ['kilograms', 'kilogram', 'kg'],
-        ]
-
-        for group in similar_groups:
-            if name in group:
-                similar_terms.extend(group)
-                break
-        
-        return list(set(similar_terms))
+        return MEASURE_TERM_TO_GROUP.get(name, (name,))
 
     def _validate_model_instance(self, instance):
         """Helper to call model validation and convert Django ValidationError to DRF"""
         try:
-            instance.full_clean()
+            # the models' clean() already looks for (similar) duplicates, so skip the unique/constraint checks
+            # that would repeat that query; the unique indexes and Lower(name) constraints still back it up
+            instance.full_clean(validate_unique=False, validate_constraints=False)
         except DjangoValidationError as e:
-            if hasattr(e, 'error_dict'):
-                raise serializers.ValidationError(e.error_dict)
-            else:
-                raise serializers.ValidationError(str(e))
+            self._raise_drf_error(e)
 
-class IngredientSerializer(serializers.ModelSerializer, BaseNormalizationMixin):
+    def _save_model_instance(self, instance):
+        """Helper for models whose save() already runs full_clean (Ingredient, Unit), converting its errors to DRF"""
+        try:
+            instance.save()
+        except DjangoValidationError as e:
+            self._raise_drf_error(e)
+
+    def _raise_drf_error(self, e):
+        if hasattr(e, 'error_dict'):
+            raise serializers.ValidationError(e.error_dict)
+        else:
+            raise serializers.ValidationError(str(e))
+
+class IngredientSerializer(CachedFieldsModelSerializer, BaseNormalizationMixin):
     def validate_name(self, value):
         # create temporary instance to test validation
         normalized_value = self._normalize_name(value)
@@ -50,18 +67,15 @@ class IngredientSerializer(serializers.ModelSerializer, BaseNormalizationMixin):
         # check for similar terms conflicts manually since we can't rely on model validation here
         similar_terms = self._get_similar_terms(normalized_value)
         
-        # build query to check for conflicts with similar terms
-        query = models.Q()
-        for term in similar_terms:
-            query |= models.Q(name__iexact=term)
-        
+        # names are stored lowercased, so match the normalized terms exactly (iexact would wrap name in UPPER() and skip the index)
         # exclude current instance if updating
-        existing_ingredients = Ingredient.objects.filter(query)
+        existing_ingredients = Ingredient.objects.filter(name__in=similar_terms)
         if self.instance:
             existing_ingredients = existing_ingredients.exclude(pk=self.instance.pk)
         
-        if existing_ingredients.exists():
-            conflict = existing_ingredients.first()
+        # a single query for the conflict instead of exists() followed by first()
+        conflict = existing_ingredients.first()
+        if conflict is not None:
             raise serializers.ValidationError(
                 f'Similar ingredient already exists: "{conflict.name}" (ID: {conflict.id}). '
                 f'Terms like "{", ".join(similar_terms)}" are considered duplicates.'
@@ -71,8 +85,8 @@ class IngredientSerializer(serializers.ModelSerializer, BaseNormalizationMixin):
 
     def create(self, validated_data):
         instance = Ingredient(**validated_data)
-        self._validate_model_instance(instance)
-        instance.save()
+        # save() runs full_clean for a new ingredient, validating here first would only repeat its queries
+        self._save_model_instance(instance)
         return instance
 
     def update(self, instance, validated_data):
@@ -81,17 +95,22 @@ class IngredientSerializer(serializers.ModelSerializer, BaseNormalizationMixin):
         instance.save()
         return instance
 
+    def to_representation(self, instance):
+        # read path built straight from the attributes instead of walking self.fields,
+        # this runs once per ingredient row of every dish in a list
+        return {"id": instance.id, "name": instance.name}
+
     class Meta:
         model = Ingredient
         fields = ["id", "name"]
 
-class CookingStepSerializer(serializers.ModelSerializer):
+class CookingStepSerializer(CachedFieldsModelSerializer):
     class Meta:
         model = CookingStep
         fields = ["id", "step_number", "instruction", "image"]
         extra_kwargs = {"image": {"required": False}}
 
-class UnitSerializer(serializers.ModelSerializer, BaseNormalizationMixin):
+class UnitSerializer(CachedFieldsModelSerializer, BaseNormalizationMixin):
     def validate(self, data):
         if not data.get("name", "").strip():
             raise serializers.ValidationError({"name": "Name cannot be empty"})
@@ -130,12 +149,61 @@ class UnitSerializer(serializers.ModelSerializer, BaseNormalizationMixin):
         instance.save()
         return instance
 
+    def to_representation(self, instance):
+        # same as IngredientSerializer: plain columns, no per-field to_representation needed
+        return {"id": instance.id, "name": instance.name, "abbreviation": instance.abbreviation}
+
     class Meta:
         model = Unit
         fields = ["id", "name", "abbreviation"]
 
-class DishIngredientSerializer(serializers.ModelSerializer, BaseNormalizationMixin):
-    ingredient_id = serializers.PrimaryKeyRelatedField(
+class PreloadedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    PrimaryKeyRelatedField that first checks the objects its parent serializer has preloaded
+    (see DishIngredientListSerializer) and only queries for a pk that isn't there.
+    """
+    def to_internal_value(self, data):
+        preloaded = getattr(self.parent, "_preloaded", {}).get(self.source)
+        if preloaded:
+            try:
+                pk = self.get_queryset().model._meta.pk.to_python(data)
+            except DjangoValidationError:
+                pk = None
+            if pk in preloaded:
+                return preloaded[pk]
+        return super().to_internal_value(data)
+
+class DishIngredientListSerializer(serializers.ListSerializer):
+    """
+    Validates a dish's whole ingredient list with one query for the ingredient ids and one for the unit ids,
+    instead of two lookups per row from the child's primary key fields.
+    """
+    def _collect_ids(self, data, field):
+        ids = set()
+        for item in data:
+            value = item.get(field) if isinstance(item, dict) else None
+            if isinstance(value, dict):
+                value = value.get("id")
+            if isinstance(value, int) or (isinstance(value, str) and value.isdigit()):
+                ids.add(int(value))
+        return ids
+
+    def to_internal_value(self, data):
+        if not isinstance(data, list):
+            return super().to_internal_value(data)  # let DRF report the type error
+        ingredient_ids = self._collect_ids(data, "ingredient_id")
+        unit_ids = self._collect_ids(data, "unit_id")
+        self.child._preloaded = {
+            "ingredient": Ingredient.objects.in_bulk(ingredient_ids) if ingredient_ids else {},
+            "unit": Unit.objects.in_bulk(unit_ids) if unit_ids else {},
+        }
+        try:
+            return super().to_internal_value(data)
+        finally:
+            del self.child._preloaded
+
+class DishIngredientSerializer(CachedFieldsModelSerializer, BaseNormalizationMixin):
+    ingredient_id = PreloadedPrimaryKeyRelatedField(
         queryset=Ingredient.objects.all(), 
         required=False, 
         write_only=True,
@@ -146,7 +214,7 @@ class DishIngredientSerializer(serializers.ModelSerializer, BaseNormalizationMix
     )
     ingredient_detail = IngredientSerializer(source="ingredient", read_only=True)
 
-    unit_id = serializers.PrimaryKeyRelatedField(
+    unit_id = PreloadedPrimaryKeyRelatedField(
         queryset=Unit.objects.all(), 
         required=False, 
         write_only=True,
@@ -157,6 +225,7 @@ class DishIngredientSerializer(serializers.ModelSerializer, BaseNormalizationMix
 
     class Meta:
         model = DishIngredient
+        list_serializer_class = DishIngredientListSerializer
         fields = [
             "id",
             "ingredient_id", 
@@ -171,19 +240,22 @@ class DishIngredientSerializer(serializers.ModelSerializer, BaseNormalizationMix
     def to_internal_value(self, data):
         """Handle both 'ingredient' and 'ingredient_id' field names for backward compatibility"""
         if isinstance(data, dict):
-            data = data.copy()
-            
-            # handle ingredient
-            if 'ingredient_id' in data:
-                if isinstance(data['ingredient_id'], dict):
+            # only copy when an id actually needs unwrapping, plain ids (the common case) pass through untouched
+            # (still a copy rather than in place, the dict belongs to request.data)
+            ingredient_id = data.get('ingredient_id')
+            unit_id = data.get('unit_id')
+            if isinstance(ingredient_id, dict) or isinstance(unit_id, dict):
+                data = data.copy()
+
+                # handle ingredient
+                if isinstance(ingredient_id, dict):
                     # if it's an object, extract the ID
-                    data['ingredient_id'] = data['ingredient_id'].get('id', data['ingredient_id'])
-            
-            # handle unit
-            if 'unit_id' in data:
-                if isinstance(data['unit_id'], dict):
+                    data['ingredient_id'] = ingredient_id.get('id', ingredient_id)
+
+                # handle unit
+                if isinstance(unit_id, dict):
                     # if it's an object, extract the ID
-                    data['unit_id'] = data['unit_id'].get('id', data['unit_id'])
+                    data['unit_id'] = unit_id.get('id', unit_id)
         
         return super().to_internal_value(data)
 
@@ -193,18 +265,18 @@ class DishIngredientSerializer(serializers.ModelSerializer, BaseNormalizationMix
         
         # check for existing similar ingredients first
         similar_terms = self._get_similar_terms(normalized_name)
-        query = models.Q()
-        for term in similar_terms:
-            query |= models.Q(name__iexact=term)
-        
-        existing = Ingredient.objects.filter(query).first()
+        existing = Ingredient.objects.filter(name__in=similar_terms).first()
         if existing:
             return existing
         
-        # create new ingredient with validation
+        # create new ingredient, save() validates a new row itself so a full_clean here would only repeat its queries
         ingredient = Ingredient(name=name.strip())
-        self._validate_model_instance(ingredient)
-        ingredient.save()
+        try:
+            with transaction.atomic():
+                self._save_model_instance(ingredient)
+        except IntegrityError:
+            # inserted by a concurrent request since the lookup above
+            return Ingredient.objects.get(name=normalized_name)
         return ingredient
 
     def _get_or_create_unit(self, name):
@@ -213,20 +285,112 @@ class DishIngredientSerializer(serializers.ModelSerializer, BaseNormalizationMix
         
         # check for existing similar units
         similar_terms = self._get_similar_terms(normalized_name)
-        query = models.Q()
-        for term in similar_terms:
-            query |= models.Q(name__iexact=term) | models.Q(abbreviation__iexact=term)
-        
-        existing = Unit.objects.filter(query).first()
+        existing = Unit.objects.filter(
+            models.Q(name__in=similar_terms) | models.Q(abbreviation__in=similar_terms)
+        ).first()
         if existing:
             return existing
         
-        # create new unit with validation
+        # create new unit, save() validates a new row itself
         unit = Unit(name=name.strip())
-        self._validate_model_instance(unit)
-        unit.save()
+        try:
+            with transaction.atomic():
+                self._save_model_instance(unit)
+        except IntegrityError:
+            # inserted by a concurrent request since the lookup above
+            return Unit.objects.get(name=normalized_name)
         return unit
 
+    def _get_or_create_ingredients(self, names):
+        """
+        Bulk version of _get_or_create_ingredient for a whole ingredient list.
+        Returns a dict mapping each given name to its Ingredient, using one lookup query for the existing ones
+        and one bulk insert (plus a re-read for the primary keys) for the rest.
+        """
+        terms_by_name = {name: self._get_similar_terms(name) for name in names}
+        all_terms = {term for terms in terms_by_name.values() for term in terms}
+        existing = Ingredient.objects.filter(name__in=all_terms).in_bulk(field_name="name")
+
+        # names with no similar ingredient yet, one new row per group of similar terms
+        new_by_terms = {}
+        for name, terms in terms_by_name.items():
+            if not any(term in existing for term in terms) and terms not in new_by_terms:
+                ingredient = Ingredient(name=self._normalize_name(name))
+                try:
+                    ingredient.clean_fields()  # the similar-terms check is the lookup above
+                except DjangoValidationError as e:
+                    raise serializers.ValidationError({"ingredient_name": e.messages})
+                new_by_terms[terms] = ingredient
+
+        if new_by_terms:
+            self._check_new_similar_terms(Ingredient, new_by_terms.values(), "ingredient_name")
+            # ignore_conflicts: a row inserted concurrently is simply picked up by the re-read
+            Ingredient.objects.bulk_create(new_by_terms.values(), ignore_conflicts=True)
+            new_names = [ingredient.name for ingredient in new_by_terms.values()]
+            for ingredient in Ingredient.objects.filter(name__in=new_names):
+                existing[ingredient.name] = ingredient
+
+        # a name with several similar matches gets the oldest one, like .first() does
+        return {
+            name: min((existing[term] for term in terms if term in existing), key=lambda i: i.pk)
+            for name, terms in terms_by_name.items()
+        }
+
+    def _get_or_create_units(self, names):
+        """Bulk version of _get_or_create_unit, matching similar terms against both name and abbreviation"""
+        terms_by_name = {name: self._get_similar_terms(name) for name in names}
+        all_terms = {term for terms in terms_by_name.values() for term in terms}
+        units = list(
+            Unit.objects.filter(models.Q(name__in=all_terms) | models.Q(abbreviation__in=all_terms)).order_by("pk")
+        )
+
+        def match(terms):
+            # first unit (by pk) whose name or abbreviation is one of the terms
+            return next((u for u in units if u.name in terms or u.abbreviation in terms), None)
+
+        new_by_terms = {}
+        for name, terms in terms_by_name.items():
+            if match(terms) is None and terms not in new_by_terms:
+                unit = Unit(name=self._normalize_name(name))
+                try:
+                    unit.clean_fields()
+                except DjangoValidationError as e:
+                    raise serializers.ValidationError({"unit_name": e.messages})
+                new_by_terms[terms] = unit
+
+        if new_by_terms:
+            self._check_new_similar_terms(Unit, new_by_terms.values(), "unit_name")
+            Unit.objects.bulk_create(new_by_terms.values(), ignore_conflicts=True)
+            new_names = [unit.name for unit in new_by_terms.values()]
+            units.extend(Unit.objects.filter(name__in=new_names).order_by("pk"))
+
+        return {name: match(terms) for name, terms in terms_by_name.items()}
+
+    def _check_new_similar_terms(self, model, new_rows, field):
+        """
+        The lookups above use the serializers' unit of measure groups, but the models' clean() also treats time terms
+        (minutes, hours) as similar. bulk_create skips the full_clean that would run that check, so run it here
+        for all the new rows with one query. New rows in the same group conflict with each other too,
+        as they would if they were saved one at a time.
+        """
+        terms_by_row = [(row, row._get_similar_terms(row.name)) for row in new_rows]
+        all_terms = {term for _, terms in terms_by_row for term in terms}
+        lookup = models.Q(name__in=all_terms)
+        if model is Unit:
+            lookup |= models.Q(abbreviation__in=all_terms)
+        taken = list(model.objects.filter(lookup).order_by("pk"))
+
+        for row, terms in terms_by_row:
+            conflict = next(
+                (other for other in taken if other.name in terms or getattr(other, "abbreviation", "") in terms), None
+            )
+            if conflict is not None:
+                found = f'"{conflict.name}" (ID: {conflict.id})' if conflict.id else f'"{conflict.name}"'
+                raise serializers.ValidationError({field: [
+                    f'"{row.name}" conflicts with {found}. Terms like "{", ".join(terms)}" are considered duplicates.'
+                ]})
+            taken.append(row)
+
     def create(self, validated_data):
         with transaction.atomic():
             # Handle ingredient - priority: ingredient_name over ingredient_id
@@ -255,10 +419,21 @@ class DishIngredientSerializer(serializers.ModelSerializer, BaseNormalizationMix
             
             return super().create(validated_data)
 
-class DishSerializer(serializers.ModelSerializer, BaseNormalizationMixin):
+class DishSerializer(CachedFieldsModelSerializer, BaseNormalizationMixin):
     dishingredient_set = DishIngredientSerializer(many=True, required=False)
     steps = CookingStepSerializer(many=True, required=False)
 
+    # relations the nested serializers read, applied by the viewset so a list of dishes
+    # costs a fixed number of queries instead of a few per dish
+    # (select_related(None) drops the managers' default dish join, the prefetch already fills it in)
+    PREFETCH_RELATED = (
+        models.Prefetch(
+            "dishingredient_set",
+            queryset=DishIngredient.objects.select_related(None).select_related("ingredient", "unit"),
+        ),
+        models.Prefetch("steps", queryset=CookingStep.objects.select_related(None)),
+    )
+
     class Meta:
         model = Dish
         fields = [
@@ -286,78 +461,127 @@ class DishSerializer(serializers.ModelSerializer, BaseNormalizationMixin):
         ingredients_data = validated_data.pop("dishingredient_set", [])
         steps_data = validated_data.pop("steps", [])
 
-        dish = Dish.objects.create(**validated_data)
-
-        ingredient_serializer = DishIngredientSerializer()
-
-        # Create dish ingredients
-        for ingredient_data in ingredients_data:
-            data = ingredient_data.copy()
-        
-            # Handle ingredient
-            if 'ingredient_name' in data:
-                ingredient = ingredient_serializer._get_or_create_ingredient(data.pop('ingredient_name'))
-                data['ingredient'] = ingredient
-            
-            # Handle unit
-            if 'unit_name' in data:
-                unit = ingredient_serializer._get_or_create_unit(data.pop('unit_name'))
-                data['unit'] = unit
-            
-            DishIngredient.objects.create(dish=dish, **data)
+        with transaction.atomic():
+            dish = Dish.objects.create(**validated_data)
+            self._create_dish_ingredients([(dish, ingredients_data)])
 
-        for step_data in steps_data:
-            CookingStep.objects.create(dish=dish, **step_data)
+            CookingStep.objects.bulk_create(
+                [CookingStep(dish=dish, **step_data) for step_data in steps_data], batch_size=500
+            )
 
         return dish
+
+    def _create_dish_ingredients(self, ingredients_by_dish):
+        """Creates the ingredient rows for a list of (dish, ingredients_data) pairs in bulk"""
+        DishIngredient.objects.bulk_create(self._build_dish_ingredients(ingredients_by_dish), batch_size=500)
+
+    def _build_dish_ingredients(self, ingredients_by_dish):
+        """
+        Builds (unsaved) ingredient rows for a list of (dish, ingredients_data) pairs.
+        Ingredients and units given by name are looked up (and created if missing) for the whole list at once,
+        so the query count doesn't grow with the number of ingredients (or dishes).
+        """
+        all_data = [d for _, ingredients_data in ingredients_by_dish for d in ingredients_data]
+        ingredient_serializer = DishIngredientSerializer()
+        ingredient_names = [d["ingredient_name"] for d in all_data if d.get("ingredient_name", "").strip()]
+        unit_names = [d["unit_name"] for d in all_data if d.get("unit_name", "").strip()]
+        ingredients = ingredient_serializer._get_or_create_ingredients(ingredient_names) if ingredient_names else {}
+        units = ingredient_serializer._get_or_create_units(unit_names) if unit_names else {}
+
+        dish_ingredients = []
+        for dish, ingredients_data in ingredients_by_dish:
+            # the nested validated dicts are fresh per request and not read again after save, so pop from them directly
+            for data in ingredients_data:
+                # a name takes priority over an id, a blank name falls back to the id
+                ingredient_name = data.pop("ingredient_name", "")
+                if ingredient_name.strip():
+                    data["ingredient"] = ingredients[ingredient_name]
+
+                unit_name = data.pop("unit_name", "")
+                if unit_name.strip():
+                    data["unit"] = units[unit_name]
+
+                dish_ingredients.append(DishIngredient(dish=dish, **data))
+
+        return dish_ingredients
     
     def update(self, instance, validated_data):
         ingredients_data = validated_data.pop("dishingredient_set", None)
         steps_data = validated_data.pop("steps", None)
         
-        # Update the main dish fields
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
-        instance.save()
-        
-        # Handle dish_ingredients if provided
-        if ingredients_data is not None:
-            with transaction.atomic():
-                # Clear existing ingredients
-                instance.dishingredient_set.all().delete()
-                
-                # Initialize the ingredient serializer to reuse its methods
-                ingredient_serializer = DishIngredientSerializer()
-                
-                # Create new ingredients (handling both ID and name cases)
-                for ingredient_data in ingredients_data:
-                    data = ingredient_data.copy()
-                    
-                    # Handle ingredient
-                    if 'ingredient_name' in data:
-                        ingredient = ingredient_serializer._get_or_create_ingredient(data.pop('ingredient_name'))
-                        data['ingredient'] = ingredient
-                    
-                    # Handle unit
-                    if 'unit_name' in data:
-                        unit = ingredient_serializer._get_or_create_unit(data.pop('unit_name'))
-                        data['unit'] = unit
-                    
-                    DishIngredient.objects.create(dish=instance, **data)
-        
-        # Handle steps if provided
-        if steps_data is not None:
-            with transaction.atomic():
-                # Clear existing steps
-                instance.steps.all().delete()
-                
-                # Create new steps
-                for step_data in steps_data:
-                    CookingStep.objects.create(dish=instance, **step_data)
-        
+        # one transaction for the dish and both merges, so a failure part way leaves the dish as it was
+        with transaction.atomic():
+            # Update the main dish fields
+            for attr, value in validated_data.items():
+                setattr(instance, attr, value)
+            instance.save()
+
+            # Handle dish_ingredients if provided
+            if ingredients_data is not None:
+                self._merge_dish_ingredients(instance, ingredients_data)
+
+            # Handle steps if provided
+            if steps_data is not None:
+                self._merge_steps(instance, steps_data)
+
         return instance
 
-class GrocerySerializer(serializers.ModelSerializer):
+    def _merge_dish_ingredients(self, dish, ingredients_data):
+        """
+        Brings the dish's ingredient rows in line with ingredients_data, matched on the ingredient:
+        rows that are gone are deleted, changed ones are updated in bulk and new ones are bulk created,
+        so editing one ingredient of twenty touches one row instead of deleting and re-inserting all of them.
+        """
+        existing = {
+            row.ingredient_id: row
+            for row in DishIngredient.objects.select_related(None).filter(dish=dish)
+        }
+        to_create, to_update = [], []
+        # (handling both ID and name cases)
+        for row in self._build_dish_ingredients([(dish, ingredients_data)]):
+            current = existing.pop(row.ingredient_id, None)
+            if current is None:
+                to_create.append(row)
+            elif (current.quantity, current.unit_id) != (row.quantity, row.unit_id):
+                current.quantity, current.unit_id = row.quantity, row.unit_id
+                to_update.append(current)
+
+        # whatever is left in existing wasn't in the payload
+        if existing:
+            DishIngredient.objects.filter(pk__in=[row.pk for row in existing.values()]).delete()
+        if to_update:
+            DishIngredient.objects.bulk_update(to_update, ["quantity", "unit"], batch_size=500)
+        if to_create:
+            DishIngredient.objects.bulk_create(to_create, batch_size=500)
+
+    def _merge_steps(self, dish, steps_data):
+        """Same as _merge_dish_ingredients for the steps, matched on step_number"""
+        existing = {step.step_number: step for step in CookingStep.objects.select_related(None).filter(dish=dish)}
+        to_create, to_update = [], []
+        for step_data in steps_data:
+            step = existing.pop(step_data["step_number"], None)
+            if step is None:
+                to_create.append(CookingStep(dish=dish, **step_data))
+                continue
+            instruction = step_data.get("instruction", step.instruction)
+            # a step ends up exactly as sent, so an omitted image clears the old one (as re-creating it did)
+            image = step_data.get("image") or ""
+            if image or step.image:
+                # save() commits the upload and removes the replaced file, which bulk_update can't do
+                step.instruction, step.image = instruction, image
+                step.save()
+            elif step.instruction != instruction:
+                step.instruction = instruction
+                to_update.append(step)
+
+        if existing:
+            CookingStep.objects.filter(pk__in=[step.pk for step in existing.values()]).delete()
+        if to_update:
+            CookingStep.objects.bulk_update(to_update, ["instruction"], batch_size=500)
+        if to_create:
+            CookingStep.objects.bulk_create(to_create, batch_size=500)
+
+class GrocerySerializer(CachedFieldsModelSerializer):
     class Meta:
         model = GroceryItem
         fields = [
@@ -369,27 +593,43 @@ class GrocerySerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['created_at']
 
+    def to_representation(self, instance):
+        # only created_at needs the field's formatting, the rest are plain columns
+        return {
+            "id": instance.id,
+            "name": instance.name,
+            "in_cart": instance.in_cart,
+            "is_optional": instance.is_optional,
+            "created_at": self.fields["created_at"].to_representation(instance.created_at),
+        }
+
     def validate_name(self, value):
         """Clean and validate the grocery item name"""
         name = value.strip()
         if not name:
             raise serializers.ValidationError("Grocery item name cannot be empty.")
-        
-        # Check for case-insensitive duplicates (same logic as your admin)
-        duplicate_exists = GroceryItem.objects.filter(
-            name__iexact=name
-        ).exclude(pk=self.instance.pk if self.instance else None).exists()
-        
-        if duplicate_exists:
-            raise serializers.ValidationError(
-                f'"{name}" already exists in your grocery list. '
+        # case-insensitive duplicates are rejected by the grocery_name_upper_uniq constraint on insert/update,
+        # see _save_unique below, so there is no separate lookup query here
+        return name  # title-cased by GroceryItem.save()
+
+    def _save_unique(self, save, *args):
+        # run the write in a savepoint so a duplicate name can be reported without breaking the outer transaction
+        try:
+            with transaction.atomic():
+                return save(*args)
+        except IntegrityError as e:
+            # psycopg reports the violated constraint on the driver error Django chains as __cause__
+            if getattr(getattr(e.__cause__, "diag", None), "constraint_name", None) != "grocery_name_upper_uniq":
+                raise
+            raise serializers.ValidationError({"name": [
+                f'"{args[-1]["name"].strip()}" already exists in your grocery list. '
                 'Please edit the existing item instead.'
-            )
-        
-        return name.title()  # Capitalize first letter of each word
+            ]})
 
     def create(self, validated_data):
-        return super().create(validated_data)
+        return self._save_unique(super().create, validated_data)
 
     def update(self, instance, validated_data):
-        return super().update(instance, validated_data)
\ No newline at end of file
+        if "name" not in validated_data:
+            return super().update(instance, validated_data)
+        return self._save_unique(super().update, instance, validated_data)
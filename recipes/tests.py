@@ -1,3 +1,311 @@
+"""
+Tests for the recipe app.
+They need PostgreSQL, like the app itself: the migrations enable pg_trgm and add expression indexes,
+and the dish changelist aggregates with ArrayAgg, so they can't run on SQLite.
+Run them with DATABASE_URL pointing at a PostgreSQL server (the test database is created next to it).
+"""
+import importlib
+from decimal import Decimal
+from unittest import mock
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import serializers
+from .models import CookingStep, Dish, DishIngredient, GroceryItem, Ingredient, Unit
+from .serializers import CachedFieldsModelSerializer, DishIngredientSerializer, DishSerializer, GrocerySerializer
 
-# Create your tests here.
+"""
+Builds a dish through the API serializer, the same path DishViewSet.create takes.
+"""
+def create_dish(name="Pasta", ingredients=(("tomato", "2"), ("onion", "1")), steps=("Chop", "Cook")):
+    serializer = DishSerializer(data={
+        "name": name,
+        "prep_time": 10,
+        "cook_time": 20,
+        "dishingredient_set": [
+            {"ingredient_name": ingredient, "quantity": quantity, "unit_name": "cup"}
+            for ingredient, quantity in ingredients
+        ],
+        "steps": [{"step_number": number, "instruction": text} for number, text in enumerate(steps, start=1)],
+    })
+    serializer.is_valid(raise_exception=True)
+    return serializer.save()
+
+class DishSerializerTests(TestCase):
+    def test_create_builds_ingredients_and_steps(self):
+        dish = create_dish()
+
+        rows = DishIngredient.objects.filter(dish=dish)
+        self.assertEqual(sorted(row.ingredient.name for row in rows), ["onion", "tomato"])
+        self.assertEqual({row.unit.name for row in rows}, {"cup"})         # matched the unit from migration 0006
+        self.assertEqual(list(dish.steps.values_list("instruction", flat=True)), ["Chop", "Cook"])
+
+    def test_update_merges_ingredients_and_steps(self):
+        dish = create_dish()
+        tomato_row = DishIngredient.objects.get(dish=dish, ingredient__name="tomato")
+        first_step = dish.steps.get(step_number=1)
+
+        serializer = DishSerializer(dish, data={
+            "dishingredient_set": [
+                {"ingredient_name": "tomato", "quantity": "3", "unit_name": "cup"},
+                {"ingredient_name": "garlic", "quantity": "1", "unit_name": "cup"},
+            ],
+            "steps": [{"step_number": 1, "instruction": "Chop finely"}],
+        }, partial=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        # the kept ingredient keeps its row, the missing one is deleted and the new one is added
+        rows = {row.ingredient.name: row for row in DishIngredient.objects.filter(dish=dish)}
+        self.assertEqual(sorted(rows), ["garlic", "tomato"])
+        self.assertEqual(rows["tomato"].pk, tomato_row.pk)
+        self.assertEqual(rows["tomato"].quantity, 3)
+
+        # same for the steps, matched on step_number
+        steps = list(CookingStep.objects.filter(dish=dish))
+        self.assertEqual([(step.pk, step.instruction) for step in steps], [(first_step.pk, "Chop finely")])
+
+    def test_failed_update_leaves_the_dish_unchanged(self):
+        dish = create_dish()
+
+        serializer = DishSerializer(dish, data={
+            "name": "Renamed",
+            "dishingredient_set": [{"ingredient_name": "garlic", "quantity": "1", "unit_name": "cup"}],
+            "steps": [{"step_number": 1, "instruction": "Boil"}],
+        }, partial=True)
+        serializer.is_valid(raise_exception=True)
+        with mock.patch.object(DishSerializer, "_merge_steps", side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                serializer.save()
+
+        dish.refresh_from_db()
+        self.assertEqual(dish.name, "Pasta")
+        self.assertEqual(
+            sorted(DishIngredient.objects.filter(dish=dish).values_list("ingredient__name", flat=True)),
+            ["onion", "tomato"],
+        )
+
+class BulkNameLookupTests(TestCase):
+    def test_serializer_term_groups_only_cover_units_of_measure(self):
+        serializer = DishIngredientSerializer()
+        self.assertIn("tablespoon", serializer._get_similar_terms("tbsp"))
+        self.assertEqual(serializer._get_similar_terms("mins"), ("mins",))
+
+    def test_similar_names_share_one_ingredient(self):
+        ingredients = DishIngredientSerializer()._get_or_create_ingredients(["Basil", " basil"])
+        self.assertEqual(ingredients["Basil"].pk, ingredients[" basil"].pk)
+        self.assertEqual(Ingredient.objects.filter(name="basil").count(), 1)
+
+    def test_time_terms_conflict_with_an_existing_ingredient(self):
+        Ingredient.objects.create(name="minute")
+        with self.assertRaises(serializers.ValidationError):
+            DishIngredientSerializer()._get_or_create_ingredients(["mins"])
+        self.assertFalse(Ingredient.objects.filter(name="mins").exists())
+
+    def test_time_terms_conflict_within_one_payload(self):
+        with self.assertRaises(serializers.ValidationError):
+            DishIngredientSerializer()._get_or_create_units(["hours", "hr"])
+        self.assertFalse(Unit.objects.filter(name__in=["hours", "hr"]).exists())
+
+class GroceryDuplicateTests(TestCase):
+    def test_duplicate_name_is_a_validation_error(self):
+        GroceryItem.objects.create(name="milk")
+        serializer = GrocerySerializer(data={"name": " MILK "})
+        self.assertTrue(serializer.is_valid())                          # duplicates are caught by the constraint on save
+        with self.assertRaises(serializers.ValidationError) as ctx:
+            serializer.save()
+        self.assertIn("name", ctx.exception.detail)
+        # the savepoint kept the test's transaction usable
+        self.assertEqual(GroceryItem.objects.count(), 1)
+
+    """
+    Runs the data step of migration 0018 against case variants, which can only exist with the constraint dropped
+    (PostgreSQL rolls the DDL back with the rest of the test).
+    """
+    def test_migration_merges_case_variants(self):
+        migration = importlib.import_module("recipes.migrations.0018_groceryitem_grocery_name_upper_uniq")
+        constraint = next(c for c in GroceryItem._meta.constraints if c.name == "grocery_name_upper_uniq")
+        with connection.schema_editor() as editor:
+            editor.remove_constraint(GroceryItem, constraint)
+
+        cup, gram = Unit.objects.get(name="cup"), Unit.objects.get(name="gram")
+        # bulk_create skips GroceryItem.save(), which would title-case the names into exact duplicates
+        GroceryItem.objects.bulk_create([
+            GroceryItem(name="Milk", quantity=Decimal("1"), unit=cup),
+            GroceryItem(name="MILK", quantity=Decimal("2"), unit=cup, in_cart=True),
+            GroceryItem(name="milk", quantity=Decimal("500"), unit=gram, is_optional=True),
+        ])
+        migration.merge_case_duplicates(apps, None)
+
+        milk = GroceryItem.objects.get()
+        self.assertEqual(milk.name, "Milk")                             # the oldest row is the one kept
+        self.assertEqual((milk.quantity, milk.unit), (Decimal("3"), cup))   # same unit added up, grams reported
+        self.assertTrue(milk.in_cart)
+        self.assertFalse(milk.is_optional)
+
+class DishListQueryTests(TestCase):
+    def test_dish_list_query_count_does_not_grow_with_the_dishes(self):
+        for name in ("Pasta", "Soup", "Salad"):
+            create_dish(name=name)
+        # one query for the dishes, one for all their ingredient rows (with ingredient and unit joined in)
+        # and one for all their steps
+        with self.assertNumQueries(3):
+            response = self.client.get("/api/dishes/", HTTP_ACCEPT="application/json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 3)
+        self.assertEqual(len(response.json()[0]["dishingredient_set"]), 2)
+
+class DishTimeFilterTests(TestCase):
+    def setUp(self):
+        user = get_user_model().objects.create_superuser("admin", "admin@example.com", "password")
+        self.client.force_login(user)
+        Dish.objects.bulk_create([
+            Dish(name="Toast", prep_time=5, cook_time=5),
+            Dish(name="Stew", prep_time=20, cook_time=90),
+        ])
+
+    def filtered_names(self, **params):
+        response = self.client.get(reverse("admin:recipes_dish_changelist"), params)
+        return sorted(dish.name for dish in response.context["cl"].result_list)
+
+    def test_buckets_filter_on_their_range(self):
+        self.assertEqual(self.filtered_names(prep_time_range="0-15"), ["Toast"])
+        self.assertEqual(self.filtered_names(prep_time_range="15-30"), ["Stew"])
+        self.assertEqual(self.filtered_names(cook_time_range="30-60"), [])
+        self.assertEqual(self.filtered_names(cook_time_range="60+"), ["Stew"])
+        self.assertEqual(self.filtered_names(), ["Stew", "Toast"])
+
+class LimitedUploadMiddlewareTests(TestCase):
+    def test_oversized_request_is_rejected_before_the_view(self):
+        response = self.client.generic(
+            "POST", "/api/grocery/", b"{}", content_type="application/json",
+            CONTENT_LENGTH=str(settings.MAX_UPLOAD_REQUEST_SIZE + 1),
+        )
+        self.assertEqual(response.status_code, 413)
+        self.assertEqual(GroceryItem.objects.count(), 0)
+
+class CachedFieldsModelSerializerTests(TestCase):
+    def test_fields_are_built_once_and_copied_per_instance(self):
+        class UnitNameSerializer(CachedFieldsModelSerializer):
+            class Meta:
+                model = Unit
+                fields = ["id", "name"]
+
+        get_fields = serializers.ModelSerializer.get_fields
+        with mock.patch.object(
+            serializers.ModelSerializer, "get_fields", autospec=True, side_effect=get_fields
+        ) as built:
+            first, second = UnitNameSerializer(), UnitNameSerializer()
+            self.assertEqual(list(first.fields), ["id", "name"])
+            self.assertEqual(list(second.fields), ["id", "name"])
+
+        self.assertEqual(built.call_count, 1)
+        # each instance binds its own copies
+        self.assertIsNot(first.fields["name"], second.fields["name"])
+        self.assertIs(first.fields["name"].parent, first)
+
+class PreloadedRelatedFieldTests(TestCase):
+    def setUp(self):
+        self.cup = Unit.objects.get(name="cup")
+        self.ingredients = [Ingredient.objects.create(name=name) for name in ("rice", "beans", "corn")]
+
+    def validate(self, ingredient_ids):
+        serializer = DishSerializer(data={
+            "name": "Bowl",
+            "prep_time": 10,
+            "cook_time": 20,
+            "dishingredient_set": [
+                {"ingredient_id": pk, "quantity": "1", "unit_id": self.cup.pk} for pk in ingredient_ids
+            ],
+        })
+        with CaptureQueriesContext(connection) as queries:
+            valid = serializer.is_valid()
+        return valid, serializer, len(queries)
+
+    def test_query_count_does_not_grow_with_the_ingredients(self):
+        one = self.validate([self.ingredients[0].pk])
+        three = self.validate([ingredient.pk for ingredient in self.ingredients])
+        self.assertTrue(one[0] and three[0])
+        self.assertEqual(one[2], three[2])
+        self.assertEqual(
+            [row["ingredient"] for row in three[1].validated_data["dishingredient_set"]], self.ingredients
+        )
+
+    def test_unknown_id_is_still_rejected(self):
+        valid, serializer, _ = self.validate([self.ingredients[0].pk, 999999])
+        self.assertFalse(valid)
+        self.assertIn("dishingredient_set", serializer.errors)
+
+"""
+These simulate a row inserted by a concurrent request between the lookup and the insert:
+the lookup is made to miss and validation is skipped, so the insert itself hits the unique constraint.
+"""
+class InsertConflictFallbackTests(TestCase):
+    def test_ingredient_conflict_returns_the_existing_row(self):
+        existing = Ingredient.objects.create(name="tomato")
+        with mock.patch.object(DishIngredientSerializer, "_get_similar_terms", return_value=("no match",)), \
+                mock.patch.object(Ingredient, "full_clean"):
+            ingredient = DishIngredientSerializer()._get_or_create_ingredient("Tomato")
+        self.assertEqual(ingredient.pk, existing.pk)
+
+    def test_unit_conflict_returns_the_existing_row(self):
+        existing = Unit.objects.get(name="gram")                        # created by migration 0006
+        with mock.patch.object(DishIngredientSerializer, "_get_similar_terms", return_value=("no match",)), \
+                mock.patch.object(Unit, "full_clean"):
+            unit = DishIngredientSerializer()._get_or_create_unit("Gram")
+        self.assertEqual(unit.pk, existing.pk)
+
+class DishAdminSaveFormsetTests(TestCase):
+    def setUp(self):
+        user = get_user_model().objects.create_superuser("admin", "admin@example.com", "password")
+        self.client.force_login(user)
+
+    def management_form(self, prefix, total, initial):
+        return {
+            f"{prefix}-TOTAL_FORMS": total, f"{prefix}-INITIAL_FORMS": initial,
+            f"{prefix}-MIN_NUM_FORMS": 0, f"{prefix}-MAX_NUM_FORMS": 1000,
+        }
+
+    def test_inline_rows_are_updated_deleted_and_added(self):
+        dish = create_dish()
+        cup = Unit.objects.get(name="cup")
+        garlic = Ingredient.objects.create(name="garlic")
+        tomato = DishIngredient.objects.get(dish=dish, ingredient__name="tomato")
+        onion = DishIngredient.objects.get(dish=dish, ingredient__name="onion")
+        chop, cook = dish.steps.all()
+
+        data = {"name": dish.name, "description": "", "prep_time": 10, "cook_time": 20, "_save": "Save"}
+        data.update(self.management_form("dishingredient_set", 3, 2))
+        for i, (row_id, ingredient_id, quantity) in enumerate([
+            (tomato.pk, tomato.ingredient_id, "5"),                     # edited
+            (onion.pk, onion.ingredient_id, "1"),                       # deleted below
+            ("", garlic.pk, "2"),                                       # added
+        ]):
+            data.update({
+                f"dishingredient_set-{i}-id": row_id, f"dishingredient_set-{i}-dish": dish.pk,
+                f"dishingredient_set-{i}-ingredient": ingredient_id, f"dishingredient_set-{i}-quantity": quantity,
+                f"dishingredient_set-{i}-unit": cup.pk,
+            })
+        data["dishingredient_set-1-DELETE"] = "on"
+        data.update(self.management_form("steps", 3, 2))
+        for i, (step_id, number, text) in enumerate([(chop.pk, 1, "Chop"), (cook.pk, 2, "Cook"), ("", 3, "Simmer")]):
+            data.update({
+                f"steps-{i}-id": step_id, f"steps-{i}-dish": dish.pk,
+                f"steps-{i}-step_number": number, f"steps-{i}-instruction": text,
+            })
+        data["steps-1-DELETE"] = "on"
+
+        response = self.client.post(reverse("admin:recipes_dish_change", args=[dish.pk]), data)
+        self.assertEqual(response.status_code, 302)
+
+        rows = {row.ingredient.name: row for row in DishIngredient.objects.filter(dish=dish)}
+        self.assertEqual(sorted(rows), ["garlic", "tomato"])
+        self.assertEqual((rows["tomato"].pk, rows["tomato"].quantity), (tomato.pk, 5))
+        self.assertEqual(rows["garlic"].quantity, 2)
+        self.assertEqual(
+            list(dish.steps.values_list("step_number", "instruction")), [(1, "Chop"), (3, "Simmer")]
+        )
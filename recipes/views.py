@@ -5,10 +5,11 @@ and for API endpoints (using Django REST Framework)
 from django.db import models
 from django.shortcuts import render
 from django.shortcuts import get_object_or_404
-from rest_framework import viewsets, status
+from rest_framework import viewsets
 from rest_framework.decorators import api_view, action
 from rest_framework.response import Response
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
+from rest_framework.pagination import LimitOffsetPagination
 from .models import Dish, Ingredient, GroceryItem, DishIngredient, Unit
 from .serializers import (
     DishSerializer,
@@ -24,7 +25,8 @@ Renders an HTML page listing
 def dish_list(
     request,
 ):
-    dishes = Dish.objects.all()
+    # only the columns list.html renders (total_time reads prep/cook time), and the ingredient names in one extra query
+    dishes = Dish.objects.only("id", "name", "image", "prep_time", "cook_time").prefetch_related("ingredients")
     return render(request, "recipes/list.html", {"dishes": dishes})
 
 
@@ -32,26 +34,18 @@ def dish_list(
 These are ModelViewSet classes, which provide CRUD (Create, Read, Update, Delete) operations for models via API endpoints.
 """
 class DishViewSet(viewsets.ModelViewSet):
-    queryset = Dish.objects.all().order_by("-id")
+    queryset = Dish.objects.none()                              # only for DRF introspection, get_queryset builds the real one
     serializer_class = DishSerializer
-    parser_classes = (MultiPartParser, FormParser, JSONParser)  # Allows file uploads
+    # Allows file uploads; DRF picks the parser from the request's content type, so JSON and form data both go through
+    # the standard create(). JSON first since it's the common case.
+    parser_classes = (JSONParser, MultiPartParser, FormParser)
 
-    def create(self, request, *args, **kwargs):
-        # Handle both form data and JSON input
-        if request.content_type == 'application/json':
-            return self.create_from_json(request, *args, **kwargs)
-        return super().create(request, *args, **kwargs)
-
-    def create_from_json(self, request, *args, **kwargs):
-        serializer = self.get_serializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-        self.perform_create(serializer)
-        headers = self.get_success_headers(serializer.data)
-        return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
-    
     def get_queryset(self):
         """Optional filtering"""
-        queryset = super().get_queryset()
+        queryset = Dish.objects.order_by("-id")
+        # eager-load whatever the serializer's nested fields need, a delete never serializes the dish so it skips this
+        if self.action != "destroy":
+            queryset = queryset.prefetch_related(*self.get_serializer_class().PREFETCH_RELATED)
         cook_time = self.request.query_params.get("cook_time")
         if cook_time:
             queryset = queryset.filter(cook_time__lte=cook_time)
@@ -71,27 +65,31 @@ This class creates an API endpoint for managing grocery objects using Django RES
 class GroceryViewSet(viewsets.ModelViewSet):
     queryset = GroceryItem.objects.all()
     serializer_class = GrocerySerializer
+    # opt-in paging: ?limit=50&offset=100 returns a page, without limit the full list comes back as before
+    pagination_class = LimitOffsetPagination
     
     def get_queryset(self):
         """Custom queryset with filtering options"""
-        queryset = GroceryItem.objects.all()
-        
+        params = self.request.query_params
+        filters = {}                                            # collected first so the queryset is built with a single filter() call
+
         # Filter by cart status
-        in_cart = self.request.query_params.get('in_cart', None)
+        in_cart = params.get('in_cart')
         if in_cart is not None:
-            queryset = queryset.filter(in_cart=in_cart.lower() == 'true')
+            filters['in_cart'] = in_cart.lower() == 'true'
         
         # Filter by optional status
-        is_optional = self.request.query_params.get('is_optional', None)
+        is_optional = params.get('is_optional')
         if is_optional is not None:
-            queryset = queryset.filter(is_optional=is_optional.lower() == 'true')
+            filters['is_optional'] = is_optional.lower() == 'true'
         
         # Search by name
-        search = self.request.query_params.get('search', None)
+        search = params.get('search')
         if search:
-            queryset = queryset.filter(name__icontains=search)
+            filters['name__icontains'] = search
 
-        return queryset.order_by('-in_cart', 'name')
+        # the model's default ordering is already ('-in_cart', 'name')
+        return GroceryItem.objects.filter(**filters)
     @action(detail=False, methods=['post'])
     def mark_all_in_cart(self, request):
         """Mark all unchecked items as in cart"""
@@ -103,14 +101,15 @@ class GroceryViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['post'])
     def clear_cart(self, request):
         """Remove all items that are in cart"""
-        deleted_count = GroceryItem.objects.filter(in_cart=True).count()
-        GroceryItem.objects.filter(in_cart=True).delete()
+        # delete() already returns how many rows it removed, no need for a separate COUNT
+        deleted_count, _ = GroceryItem.objects.filter(in_cart=True).delete()
         return Response({
             'message': f'{deleted_count} items removed from grocery list'
         })
 
 class DishIngredientViewSet(viewsets.ModelViewSet):
-    queryset = DishIngredient.objects.all()
+    # the serializer renders the ingredient and unit but never the dish, so drop the manager's dish join
+    queryset = DishIngredient.objects.select_related(None).select_related("ingredient", "unit")
     serializer_class = DishIngredientSerializer
 
     def get_queryset(self):